@@ -0,0 +1,89 @@
+"""Per-query Python overhead benchmark.
+
+Compares building the controllers' query shapes on every call (as they used
+to) with executing the statements cached at import time with bound
+parameters, against an in-memory SQLite database.
+
+Usage:
+    python -m benchmarks.query_overhead [--number 5000]
+"""
+import argparse
+import timeit
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from src.controllers.auth import USER_BY_EMAIL_STATEMENT
+from src.controllers.task import USER_TASK_STATEMENT, USER_TASKS_STATEMENT
+from src.models.task import Task
+from src.models.user import User, UserRole
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            User(name="John", email="john@mail.com", role=UserRole.USER, password="")
+        )
+        session.add(Task(title="Task", user_id=1))
+        session.commit()
+
+        user_id, task_id, email = 1, 1, "john@mail.com"
+        cases = {
+            "task by id": (
+                lambda: session.exec(
+                    select(Task)
+                    .join(User)
+                    .where(User.id == user_id)
+                    .where(Task.id == task_id)
+                ).one_or_none(),
+                lambda: session.exec(
+                    USER_TASK_STATEMENT,
+                    params={"user_id": user_id, "task_id": task_id},
+                ).one_or_none(),
+            ),
+            "user tasks": (
+                lambda: session.exec(
+                    select(Task).join(User).where(User.id == user_id)
+                ).all(),
+                lambda: session.exec(
+                    USER_TASKS_STATEMENT, params={"user_id": user_id}
+                ).all(),
+            ),
+            "user by email": (
+                lambda: session.exec(
+                    select(User).where(
+                        User.email == email, User.is_deleted == False
+                    )
+                ).one_or_none(),
+                lambda: session.exec(
+                    USER_BY_EMAIL_STATEMENT, params={"email": email}
+                ).one_or_none(),
+            ),
+        }
+
+        for name, (inline, cached) in cases.items():
+            inline_us = (
+                min(timeit.repeat(inline, number=args.number, repeat=3))
+                / args.number
+                * 1_000_000
+            )
+            cached_us = (
+                min(timeit.repeat(cached, number=args.number, repeat=3))
+                / args.number
+                * 1_000_000
+            )
+            print(
+                f"{name:<14} inline {inline_us:7.1f} us  cached {cached_us:7.1f} us"
+                f"  ({inline_us / cached_us:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
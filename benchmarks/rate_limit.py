@@ -0,0 +1,89 @@
+"""Rate limiter overhead benchmark.
+
+Measures the per-request cost RateLimitMiddleware adds in front of a no-op
+ASGI app, for anonymous (client IP) and authenticated (JWT subject) requests.
+
+Usage:
+    python -m benchmarks.rate_limit [--requests 100000]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("HASH_ALGORITHM", "HS256")
+
+from src.core.auth import create_access_token  # noqa: E402
+from src.core.rate_limit import (  # noqa: E402
+    DEFAULT_RATE_LIMITS,
+    RateLimitMiddleware,
+    parse_rate_limits,
+)
+
+
+async def noop_app(scope, receive, send):
+    pass
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+def make_scope(method: str, path: str, headers: list, client_index: int) -> dict:
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "headers": headers,
+        "client": (f"10.0.{client_index // 256 % 256}.{client_index % 256}", 1234),
+    }
+
+
+async def run(app, scopes: list[dict]) -> float:
+    start = time.perf_counter()
+
+    for scope in scopes:
+        await app(scope, receive, send)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Huge capacities so every request goes through the full admitted path.
+    limits = parse_rate_limits(DEFAULT_RATE_LIMITS.replace("/60", "000000/60"))
+    limiter = RateLimitMiddleware(noop_app, limits=limits)
+    token = create_access_token({"sub": "john.doe@mail.com", "role": "user"})
+    auth_headers = [(b"authorization", f"Bearer {token}".encode())]
+
+    cases = {
+        "unmatched route": [
+            make_scope("GET", "/", [], i) for i in range(args.requests)
+        ],
+        "login, by client IP": [
+            make_scope("POST", "/auth/login", [], i) for i in range(args.requests)
+        ],
+        "tasks, by JWT subject": [
+            make_scope("GET", "/users/me/tasks", auth_headers, i)
+            for i in range(args.requests)
+        ],
+    }
+
+    for name, scopes in cases.items():
+        baseline = asyncio.run(run(noop_app, scopes))
+        limited = asyncio.run(run(limiter, scopes))
+        overhead_us = (limited - baseline) / len(scopes) * 1_000_000
+        print(f"{name:<24} {overhead_us:8.2f} us/request overhead")
+
+
+if __name__ == "__main__":
+    main()
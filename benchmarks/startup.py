@@ -0,0 +1,162 @@
+"""Startup benchmark.
+
+Measures the time from process start to the first successful request against
+a uvicorn worker, with and without FAST_START, the time of the lifespan's
+schema step on its own (the only part FAST_START changes), and the import
+time of each module pulled in by `main`. Runs of both modes are interleaved
+so drift in machine load affects them equally.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--top 20]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def benchmark_env(database_path: str, fast_start: bool) -> dict:
+    env = os.environ.copy()
+    env.setdefault("ENVIRONMENT", "development")
+    env.setdefault("ORIGINS", "*")
+    env.setdefault("METHODS", "*")
+    env.setdefault("SECRET_KEY", "benchmark")
+    env.setdefault("HASH_ALGORITHM", "HS256")
+    env.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "10")
+    env["DATABSE_URL"] = f"sqlite:///{database_path}"
+    env["FAST_START"] = "true" if fast_start else "false"
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_to_first_request(env: dict, timeout: float = 30.0) -> float:
+    """Start uvicorn and poll until the root route answers 200."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/api/v1/"
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.005)
+
+        raise TimeoutError(f"No successful response from {url}")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def schema_step_time(env: dict) -> float:
+    """Time the lifespan's schema step (create_all_tables) in a fresh process."""
+    code = (
+        "import time, main\n"
+        "from contextlib import contextmanager\n"
+        "from src.db import create_all_tables\n"
+        "start = time.perf_counter()\n"
+        "with contextmanager(create_all_tables)(main.app):\n"
+        "    print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return float(result.stdout)
+
+
+def import_times(env: dict) -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, module) for every module `main` imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        times.append((int(self_us), int(cumulative_us), module.rstrip()))
+
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_path = os.path.join(tmp, "startup.db")
+
+        # Warm boot creates the schema so both modes start from the same state.
+        time_to_first_request(benchmark_env(database_path, fast_start=False))
+
+        modes = (False, True)
+        first_request = {fast_start: [] for fast_start in modes}
+        schema_step = {fast_start: [] for fast_start in modes}
+
+        for _ in range(args.runs):
+            for fast_start in modes:
+                env = benchmark_env(database_path, fast_start)
+                first_request[fast_start].append(time_to_first_request(env))
+                schema_step[fast_start].append(schema_step_time(env))
+
+        for fast_start in modes:
+            samples = first_request[fast_start]
+            print(
+                f"FAST_START={str(fast_start).lower():<5} "
+                f"first request: median {statistics.median(samples) * 1000:.1f} ms, "
+                f"min {min(samples) * 1000:.1f} ms; schema step: median "
+                f"{statistics.median(schema_step[fast_start]) * 1000:.2f} ms "
+                f"({args.runs} runs)"
+            )
+
+        times = import_times(benchmark_env(database_path, fast_start=True))
+
+    print(f"\nTop {args.top} imports by cumulative time:")
+    print(f"{'self [ms]':>10} {'cumul [ms]':>11}  module")
+    for self_us, cumulative_us, module in sorted(times, key=lambda t: -t[1])[
+        : args.top
+    ]:
+        print(f"{self_us / 1000:>10.2f} {cumulative_us / 1000:>11.2f}  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Task statistics benchmark.
+
+Seeds a SQLite database with many users and tasks and times
+`get_task_stats` with the GROUP BY aggregate and with the maintained
+per-user counters.
+
+Usage:
+    python -m benchmarks.task_stats [--users 1000] [--tasks-per-user 1000]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, create_engine
+
+from src.controllers.task import get_task_stats
+from src.models.task import Task
+from src.models.user import User, UserRole
+
+
+def seed(session: Session, users: int, tasks_per_user: int) -> None:
+    session.exec(
+        insert(User),
+        params=[
+            {
+                "id": user_id,
+                "name": f"User {user_id}",
+                "email": f"user{user_id}@mail.com",
+                "role": UserRole.USER,
+                "password": "",
+                "task_count": tasks_per_user,
+            }
+            for user_id in range(1, users + 1)
+        ],
+    )
+
+    for user_id in range(1, users + 1):
+        session.exec(
+            insert(Task),
+            params=[
+                {"title": f"Task {i}", "user_id": user_id}
+                for i in range(tasks_per_user)
+            ],
+        )
+
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--tasks-per-user", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'stats.db')}")
+        SQLModel.metadata.create_all(engine)
+
+        with Session(engine) as session:
+            seed(session, args.users, args.tasks_per_user)
+            print(
+                f"Seeded {args.users} users x {args.tasks_per_user} tasks "
+                f"({args.users * args.tasks_per_user} tasks)"
+            )
+
+            for source in ("aggregate", "counters"):
+                samples = []
+
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    stats = get_task_stats(session, source=source)
+                    samples.append(time.perf_counter() - start)
+
+                print(
+                    f"{source:<10} median {statistics.median(samples) * 1000:8.1f} ms"
+                    f"  (total_tasks={stats.total_tasks})"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 import pytest
 
+from fastapi import Request
 from fastapi.testclient import TestClient
 from sqlmodel import Session, create_engine, SQLModel
 from sqlalchemy.pool import StaticPool
 
 from main import app
 from src.db import get_session
+from src.models.user import UserCreate
 
 DATABASE_URL = "sqlite:///:memory:"
 
@@ -31,8 +33,11 @@ def session_fixture():
 
 @pytest.fixture(name="client")
 def client_fixture(session: Session):
-    def get_session_override() -> Session:
-        return session
+    def get_session_override(request: Request) -> Session:
+        # Like get_session, batch sub-requests use the batch's session.
+        batch_session = getattr(request.state, "batch_session", None)
+
+        return session if batch_session is None else batch_session
 
     app.dependency_overrides[get_session] = get_session_override
 
@@ -40,3 +45,35 @@ def client_fixture(session: Session):
     yield client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(name="login")
+def login_fixture(client: TestClient):
+    user_ids: dict[str, int] = {}
+
+    def login(role: str = "user") -> tuple[int, dict]:
+        """Sign up a `role` user on the first call and log in as them.
+
+        Returns:
+            tuple[int, dict]: The user's id and authorization headers.
+        """
+        email = f"{role}@mail.com"
+
+        if role not in user_ids:
+            user_data: UserCreate = {
+                "name": "John Doe",
+                "email": email,
+                "password": "password",
+                "role": role,
+            }
+            user_ids[role] = client.post("/api/v1/users", json=user_data).json()["id"]
+
+        login_response = client.post(
+            "/api/v1/auth/login", data={"username": email, "password": "password"}
+        )
+
+        return user_ids[role], {
+            "Authorization": f"Bearer {login_response.json()['access_token']}"
+        }
+
+    return login
@@ -1,22 +1,49 @@
 import os
 
+from contextlib import asynccontextmanager, contextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.core import load_env_file
+from src.core.jobs import run_job_workers
 from src.db import create_all_tables
-from src.routes import auth, user
+from src.routes import auth, batch, job, task, user
+
+load_env_file()
 
 allowed_origins = os.environ.get("ORIGINS").split(",")
 allowed_methods = os.environ.get("METHODS").split(",")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    with contextmanager(create_all_tables)(app), contextmanager(run_job_workers)(app):
+        yield
+
+
 app = FastAPI(
-    lifespan=create_all_tables,
+    lifespan=lifespan,
     title="Minerva API",
     description="Minerva backend",
     version="1.0.0",
     root_path="/api/v1",
 )
 
+# Opt-in features are imported only when enabled, so disabled deployments
+# don't pay their import time.
+if os.environ.get("RATE_LIMIT_ENABLED") == "true":
+    from src.core.rate_limit import (
+        DEFAULT_RATE_LIMITS,
+        RateLimitMiddleware,
+        parse_rate_limits,
+    )
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits=parse_rate_limits(os.environ.get("RATE_LIMITS", DEFAULT_RATE_LIMITS)),
+        max_in_flight=int(os.environ.get("MAX_IN_FLIGHT", "64")),
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -25,6 +52,20 @@ app.add_middleware(
 )
 app.include_router(auth.router)
 app.include_router(user.router)
+app.include_router(task.router)
+app.include_router(job.router)
+app.include_router(batch.router)
+
+if os.environ.get("PROFILING_ENABLED") == "true":
+    from src.core.profiling import ProfilingMiddleware, get_profile_store
+    from src.routes import profiling
+
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=get_profile_store(),
+        sample_rate=float(os.environ.get("PROFILING_SAMPLE_RATE", "0")),
+    )
+    app.include_router(profiling.router)
 
 
 @app.get("/")
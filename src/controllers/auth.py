@@ -1,8 +1,9 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 import jwt
 import os
 
 from jwt.exceptions import InvalidTokenError
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 
 from ..db import get_session
@@ -12,12 +13,17 @@ from ..dependencies import AuthDep
 from ..models.user import User, UserRead, UserRole
 from ..models.token import TokenData
 
+USER_BY_EMAIL_STATEMENT = select(User).where(
+    User.email == bindparam("email"), User.is_deleted == False
+)
+
 
 def authenticate_user(
     session: Session, username: str, password: str
 ) -> bool | UserRead:
-    statement = select(User).where(User.email == username)
-    user = session.exec(statement).one_or_none()
+    user = session.exec(
+        USER_BY_EMAIL_STATEMENT, params={"email": username}
+    ).one_or_none()
 
     if not user or not verify_password(password, user.password):
         raise InvalidCredentialsException("Invalid username or password")
@@ -26,13 +32,22 @@ def authenticate_user(
 
 
 def get_user(session: Session, username: str) -> User | None:
-    statement = select(User).where(User.email == username)
-    user = session.exec(statement).one_or_none()
+    user = session.exec(
+        USER_BY_EMAIL_STATEMENT, params={"email": username}
+    ).one_or_none()
 
     return user
 
 
-def get_current_user(token: AuthDep, session: Session = Depends(get_session)):
+def get_current_user(
+    request: Request, token: AuthDep, session: Session = Depends(get_session)
+):
+    # Batch sub-requests reuse the user the batch request authenticated.
+    batch_user = getattr(request.state, "batch_user", None)
+
+    if batch_user is not None:
+        return batch_user
+
     try:
         payload: dict = jwt.decode(
             token,
@@ -57,7 +72,17 @@ def get_current_user(token: AuthDep, session: Session = Depends(get_session)):
     return user
 
 
-def get_admin_user(token: AuthDep, session: Session = Depends(get_session)):
+def get_admin_user(
+    request: Request, token: AuthDep, session: Session = Depends(get_session)
+):
+    batch_user = getattr(request.state, "batch_user", None)
+
+    if batch_user is not None:
+        if batch_user.role != UserRole.ADMIN:
+            raise InvalidRoleException()
+
+        return batch_user
+
     try:
         payload: dict = jwt.decode(
             token,
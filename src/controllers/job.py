@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from sqlmodel import Session, select, update
+from typing import Any, List
+
+from ..models.job import Job, JobRead, JobStatus
+
+
+def create_job(
+    session: Session, kind: str, payload: dict[str, Any], user_id: int | None = None
+) -> JobRead | str:
+    """Enqueue a job."""
+    try:
+        job = Job(kind=kind, payload=payload, user_id=user_id)
+
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+
+        return job
+    except Exception as e:
+        session.rollback()
+        return str(e)
+
+
+def get_jobs(session: Session, status: JobStatus | None = None) -> List[JobRead]:
+    """Get all jobs, newest first."""
+    statement = select(Job).order_by(Job.id.desc())
+
+    if status:
+        statement = statement.where(Job.status == status)
+
+    return session.exec(statement).all()
+
+
+def get_job(session: Session, job_id: int) -> JobRead | None | str:
+    """Get a job by ID."""
+    try:
+        return session.get(Job, job_id)
+    except Exception as e:
+        return str(e)
+
+
+def requeue_stale_jobs(session: Session, lease: timedelta) -> int:
+    """Put back jobs that have been running for longer than `lease`.
+
+    Live workers renew the lease of their job at each checkpoint, so those
+    jobs belonged to a worker that died (or was killed) mid-job. Every
+    handler must be safe to run again.
+
+    Returns:
+        int: The number of requeued jobs.
+    """
+    requeued = session.exec(
+        update(Job)
+        .where(
+            Job.status == JobStatus.RUNNING,
+            Job.started_at < datetime.now(timezone.utc) - lease,
+        )
+        .values(status=JobStatus.PENDING, started_at=None)
+    )
+    session.commit()
+
+    return requeued.rowcount
+
+
+def renew_job(session: Session, job: Job) -> None:
+    """Restart a running job's lease so requeue_stale_jobs leaves it alone."""
+    job.started_at = datetime.now(timezone.utc)
+
+    session.add(job)
+    session.commit()
+
+
+def requeue_job(session: Session, job: Job) -> None:
+    """Put back a job its worker stopped before it finished."""
+    job.status = JobStatus.PENDING
+    job.started_at = None
+
+    session.add(job)
+    session.commit()
+
+
+def claim_job(session: Session) -> Job | None:
+    """Mark the oldest pending job as running and return it.
+
+    The conditional UPDATE makes the claim safe when several workers (or
+    processes) poll the same table: only one of them changes the row.
+    """
+    while True:
+        job_id = session.exec(
+            select(Job.id)
+            .where(Job.status == JobStatus.PENDING)
+            .order_by(Job.id)
+            .limit(1)
+        ).first()
+
+        if job_id is None:
+            session.rollback()
+            return None
+
+        claimed = session.exec(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.PENDING)
+            .values(status=JobStatus.RUNNING, started_at=datetime.now(timezone.utc))
+        )
+        session.commit()
+
+        if claimed.rowcount == 1:
+            return session.get(Job, job_id)
+
+
+def finish_job(
+    session: Session,
+    job: Job,
+    result: dict[str, Any] | None = None,
+    error: str | None = None,
+) -> None:
+    """Record the outcome of a running job."""
+    job.status = JobStatus.FAILED if error else JobStatus.SUCCEEDED
+    job.result = result
+    job.error = error
+    job.finished_at = datetime.now(timezone.utc)
+
+    session.add(job)
+    session.commit()
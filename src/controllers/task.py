@@ -1,9 +1,47 @@
-from sqlmodel import Session, select
-from typing import List
+import csv
+import json
+import logging
 
-from ..models.task import Task, TaskCreate, TaskRead, TaskUpdate
+from collections import Counter
+from itertools import islice
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, func, select, update
+from typing import BinaryIO, Iterable, Iterator, List, Literal
+
+from ..models.task import (
+    Task,
+    TaskCreate,
+    TaskImportChunk,
+    TaskImportError,
+    TaskImportReport,
+    TaskRead,
+    TaskStats,
+    TaskUpdate,
+    UserTaskCount,
+)
 from ..models.user import User
 
+IMPORT_CHUNK_SIZE = 1000
+EXPORT_CHUNK_SIZE = 1000
+MAX_ERRORS_PER_CHUNK = 20
+MAX_REPORTED_CHUNKS = 100
+
+logger = logging.getLogger(__name__)
+
+# Fixed query shapes are built once with bound parameters, so SQLAlchemy
+# does not rebuild them and recompute their cache key on every call.
+USER_TASKS_STATEMENT = select(Task).join(User).where(User.id == bindparam("user_id"))
+USER_TASK_STATEMENT = USER_TASKS_STATEMENT.where(Task.id == bindparam("task_id"))
+# Always maintained, even when stats are read with `aggregate`: counters that
+# are only updated some of the time drift and would need a recount to trust.
+TASK_COUNT_STATEMENT = (
+    update(User)
+    .where(User.id == bindparam("user_id"))
+    .values(task_count=User.task_count + bindparam("delta"))
+)
+
 
 def create_task(session: Session, task_data: TaskCreate) -> TaskRead | str:
     """Create a new task."""
@@ -11,6 +49,9 @@ def create_task(session: Session, task_data: TaskCreate) -> TaskRead | str:
         task = Task.model_validate(task_data.model_dump())
 
         session.add(task)
+        session.exec(
+            TASK_COUNT_STATEMENT, params={"user_id": task.user_id, "delta": 1}
+        )
         session.commit()
         session.refresh(task)
 
@@ -22,17 +63,15 @@ def create_task(session: Session, task_data: TaskCreate) -> TaskRead | str:
 
 def get_tasks(session: Session, user_id: int) -> List[TaskRead]:
     """Get all tasks for a user."""
-    statement = select(Task).join(User).where(User.id == user_id)
-    return session.exec(statement).all()
+    return session.exec(USER_TASKS_STATEMENT, params={"user_id": user_id}).all()
 
 
 def get_task(session: Session, user_id: int, task_id: int) -> TaskRead | None | str:
     """Get a task by ID."""
     try:
-        statement = (
-            select(Task).join(User).where(User.id == user_id).where(Task.id == task_id)
-        )
-        task = session.exec(statement).one_or_none()
+        task = session.exec(
+            USER_TASK_STATEMENT, params={"user_id": user_id, "task_id": task_id}
+        ).one_or_none()
 
         if not task:
             return None
@@ -47,10 +86,9 @@ def update_task(
 ) -> TaskRead | None | str:
     """Update a task."""
     try:
-        statement = (
-            select(Task).join(User).where(User.id == user_id).where(Task.id == task_id)
-        )
-        task = session.exec(statement).one_or_none()
+        task = session.exec(
+            USER_TASK_STATEMENT, params={"user_id": user_id, "task_id": task_id}
+        ).one_or_none()
 
         if not task:
             return None
@@ -71,18 +109,231 @@ def update_task(
 def delete_task(session: Session, user_id: int, task_id: int) -> bool | str:
     """Delete a task."""
     try:
-        statement = (
-            select(Task).join(User).where(User.id == user_id).where(Task.id == task_id)
-        )
-        task = session.exec(statement).one_or_none()
+        task = session.exec(
+            USER_TASK_STATEMENT, params={"user_id": user_id, "task_id": task_id}
+        ).one_or_none()
 
         if not task:
             return False
 
         session.delete(task)
+        session.exec(TASK_COUNT_STATEMENT, params={"user_id": user_id, "delta": -1})
         session.commit()
 
         return True
     except Exception as e:
         session.rollback()
         return str(e)
+
+
+def get_task_stats(
+    session: Session, source: Literal["aggregate", "counters"] = "aggregate"
+) -> TaskStats:
+    """Get the task count of every user with tasks and the global totals.
+
+    `aggregate` counts the Task table with GROUP BY; `counters` reads the
+    per-user counters kept by create_task and delete_task, so it never scans
+    the Task table.
+    """
+    if source == "counters":
+        statement = select(User.id, User.task_count).where(
+            User.is_deleted == False, User.task_count > 0
+        )
+    else:
+        statement = (
+            select(Task.user_id, func.count(Task.id))
+            .join(User)
+            .where(User.is_deleted == False)
+            .group_by(Task.user_id)
+        )
+
+    users = [
+        UserTaskCount(user_id=user_id, task_count=task_count)
+        for user_id, task_count in session.exec(statement).all()
+    ]
+    total_users = session.exec(
+        select(func.count(User.id)).where(User.is_deleted == False)
+    ).one()
+
+    return TaskStats(
+        total_users=total_users,
+        total_tasks=sum(user.task_count for user in users),
+        users=users,
+    )
+
+
+def read_task_rows(
+    file: BinaryIO, format: Literal["csv", "ndjson"]
+) -> Iterator[tuple[int, dict | str]]:
+    """Read task rows from a CSV or NDJSON file one line at a time.
+
+    Lines are decoded as UTF-8 (a leading byte order mark is skipped); lines
+    that are not valid UTF-8 are reported like parse errors.
+
+    Parameters:
+        file (BinaryIO): The uploaded file.
+        format (str): `csv` (with a title,description,user_id header) or
+            `ndjson` (one JSON object per line).
+
+    Yields:
+        tuple[int, dict | str]: The line number and the row, or a parse error.
+    """
+    line_number = 0
+    invalid_lines: List[tuple[int, str]] = []
+
+    def decoded_lines() -> Iterator[str]:
+        nonlocal line_number
+
+        for line_number, line in enumerate(file, start=1):
+            try:
+                yield line.decode("utf-8-sig" if line_number == 1 else "utf-8")
+            except UnicodeDecodeError as e:
+                invalid_lines.append((line_number, f"Invalid UTF-8: {e.reason}"))
+
+    if format == "csv":
+        for row in csv.DictReader(decoded_lines()):
+            yield from invalid_lines
+            invalid_lines.clear()
+
+            if row.get("description") == "":
+                row["description"] = None
+
+            yield line_number, row
+    else:
+        for line in decoded_lines():
+            yield from invalid_lines
+            invalid_lines.clear()
+
+            if not line.strip():
+                continue
+
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, f"Invalid JSON: {e}"
+
+    yield from invalid_lines
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def _import_chunk(
+    session: Session, index: int, rows: List[tuple[int, dict | str]]
+) -> TaskImportChunk:
+    errors: List[TaskImportError] = []
+    valid: List[tuple[int, dict]] = []
+
+    for line, row in rows:
+        if isinstance(row, str):
+            errors.append(TaskImportError(line=line, error=row))
+            continue
+
+        try:
+            valid.append((line, TaskCreate.model_validate(row).model_dump()))
+        except ValidationError as e:
+            errors.append(TaskImportError(line=line, error=_validation_message(e)))
+
+    user_ids = {task["user_id"] for _, task in valid}
+    known_user_ids = set(
+        session.exec(
+            select(User.id).where(User.id.in_(user_ids), User.is_deleted == False)
+        ).all()
+    )
+    lines, tasks = [], []
+
+    for line, task in valid:
+        if task["user_id"] in known_user_ids:
+            lines.append(line)
+            tasks.append(task)
+        else:
+            errors.append(TaskImportError(line=line, error="User not found"))
+
+    try:
+        if tasks:
+            session.exec(insert(Task), params=tasks)
+
+            user_table = User.__table__
+            session.connection().execute(
+                user_table.update()
+                .where(user_table.c.id == bindparam("b_user_id"))
+                .values(task_count=user_table.c.task_count + bindparam("b_count")),
+                [
+                    {"b_user_id": user_id, "b_count": count}
+                    for user_id, count in Counter(t["user_id"] for t in tasks).items()
+                ],
+            )
+
+        session.commit()
+    except IntegrityError as e:
+        session.rollback()
+        errors.extend(TaskImportError(line=line, error=str(e.orig)) for line in lines)
+        tasks = []
+
+    errors.sort(key=lambda error: error.line)
+
+    return TaskImportChunk(
+        chunk=index,
+        inserted=len(tasks),
+        failed=len(errors),
+        errors=errors[:MAX_ERRORS_PER_CHUNK],
+    )
+
+
+def import_tasks(
+    session: Session,
+    rows: Iterable[tuple[int, dict | str]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> TaskImportReport:
+    """Import tasks in chunks.
+
+    Every chunk is validated against TaskCreate, inserted with one
+    executemany and committed on its own, so a bad chunk does not undo the
+    previous ones. To keep memory flat regardless of the size of the file,
+    the report only lists the first chunks with failures, each with its first
+    errors; the progress of every chunk is logged.
+    """
+    rows = iter(rows)
+    report = TaskImportReport(inserted=0, failed=0, chunk_count=0, chunks=[])
+
+    while chunk := list(islice(rows, chunk_size)):
+        result = _import_chunk(session, report.chunk_count, chunk)
+        logger.info(
+            "Imported task chunk %s: %s inserted, %s failed",
+            result.chunk,
+            result.inserted,
+            result.failed,
+        )
+
+        report.chunk_count += 1
+        report.inserted += result.inserted
+        report.failed += result.failed
+
+        if result.failed and len(report.chunks) < MAX_REPORTED_CHUNKS:
+            report.chunks.append(result)
+
+    return report
+
+
+def export_tasks(
+    session: Session, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[List[TaskRead]]:
+    """Get all tasks in chunks ordered by ID, using keyset pagination."""
+    last_id = 0
+
+    while True:
+        tasks = session.exec(
+            select(Task).where(Task.id > last_id).order_by(Task.id).limit(chunk_size)
+        ).all()
+
+        if not tasks:
+            break
+
+        yield tasks
+
+        last_id = tasks[-1].id
+        session.expunge_all()
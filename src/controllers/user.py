@@ -1,9 +1,13 @@
-from sqlmodel import Session, select
-from typing import List
+from sqlmodel import Session, delete, select
+from typing import Callable, List
 
 from ..core.auth import make_password
+from ..models.job import Job, JobRead
+from ..models.task import Task
 from ..models.user import User, UserCreate, UserRead, UserUpdate
 
+PURGE_CHUNK_SIZE = 1000
+
 
 def create_user(session: Session, user_data: UserCreate) -> UserRead | str:
     """Create a new user."""
@@ -26,13 +30,18 @@ def create_user(session: Session, user_data: UserCreate) -> UserRead | str:
 
 def get_users(session: Session) -> List[UserRead]:
     """Get all users."""
-    return session.exec(select(User)).all()
+    return session.exec(select(User).where(User.is_deleted == False)).all()
 
 
 def get_user(session: Session, user_id: int) -> UserRead | None | str:
     """Get a user by ID."""
     try:
-        return session.get(User, user_id)
+        user = session.get(User, user_id)
+
+        if not user or user.is_deleted:
+            return None
+
+        return user
     except Exception as e:
         return str(e)
 
@@ -44,7 +53,7 @@ def update_user(
     try:
         user = session.get(User, user_id)
 
-        if not user:
+        if not user or user.is_deleted:
             return None
 
         user_update_data = user_data.model_dump(exclude_unset=True)
@@ -61,11 +70,15 @@ def update_user(
 
 
 def delete_user(session: Session, user_id: int) -> bool | str:
-    """Delete a user."""
+    """Delete a user.
+
+    The user's tasks are removed by the database (ON DELETE CASCADE), so they
+    are never loaded into the session.
+    """
     try:
         user = session.get(User, user_id)
 
-        if not user:
+        if not user or user.is_deleted:
             return False
 
         session.delete(user)
@@ -75,3 +88,71 @@ def delete_user(session: Session, user_id: int) -> bool | str:
     except Exception as e:
         session.rollback()
         return str(e)
+
+
+def tombstone_user(
+    session: Session, user_id: int, requested_by: int | None = None
+) -> JobRead | None | str:
+    """Mark a user as deleted and enqueue the job that purges their tasks.
+
+    Both changes are committed together, so a tombstoned user always has a
+    purge job.
+    """
+    try:
+        user = session.get(User, user_id)
+
+        if not user or user.is_deleted:
+            return None
+
+        user.is_deleted = True
+        job = Job(kind="purge_user", payload={"user_id": user_id}, user_id=requested_by)
+
+        session.add(user)
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+
+        return job
+    except Exception as e:
+        session.rollback()
+        return str(e)
+
+
+def purge_user(
+    session: Session,
+    user_id: int,
+    chunk_size: int = PURGE_CHUNK_SIZE,
+    should_stop: Callable[[], bool] | None = None,
+) -> bool:
+    """Delete a tombstoned user's tasks in chunks, then the user itself.
+
+    Every chunk is committed on its own so no transaction holds locks on the
+    whole task set. The purge is idempotent, so an interrupted one can simply
+    run again.
+
+    Returns:
+        bool: False if `should_stop` interrupted the purge, True otherwise.
+    """
+    user = session.get(User, user_id)
+
+    if not user or not user.is_deleted:
+        return True
+
+    while True:
+        if should_stop and should_stop():
+            return False
+
+        task_ids = session.exec(
+            select(Task.id).where(Task.user_id == user_id).limit(chunk_size)
+        ).all()
+
+        if not task_ids:
+            break
+
+        session.exec(delete(Task).where(Task.id.in_(task_ids)))
+        session.commit()
+
+    session.exec(delete(User).where(User.id == user_id, User.is_deleted == True))
+    session.commit()
+
+    return True
@@ -0,0 +1,197 @@
+import logging
+import os
+import threading
+import time
+
+from datetime import timedelta
+from fastapi import FastAPI
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from typing import Any, Callable, Generator
+
+from ..controllers import job as job_controller, user as user_controller
+from ..db import get_engine
+from ..models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Handlers get the session, the job payload and a checkpoint to call between
+# steps. The checkpoint renews the job's lease and returns True when the
+# handler should stop.
+JobHandler = Callable[
+    [Session, dict[str, Any], Callable[[], bool]], dict[str, Any] | None
+]
+
+
+class JobInterrupted(Exception):
+    """Raised by a handler that stopped early because the worker is stopping."""
+
+
+def purge_user(
+    session: Session, payload: dict[str, Any], checkpoint: Callable[[], bool]
+) -> None:
+    if not user_controller.purge_user(
+        session=session, user_id=payload["user_id"], should_stop=checkpoint
+    ):
+        raise JobInterrupted()
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    "purge_user": purge_user,
+}
+
+
+def run_next_job(session: Session, stop: threading.Event | None = None) -> Job | None:
+    """Claim and run the oldest pending job.
+
+    Parameters:
+        session (Session): The session the job runs in.
+        stop (threading.Event | None): Set when the worker is stopping;
+            handlers check it at their checkpoints and the job is requeued.
+
+    Returns:
+        Job | None: The job, or None if no job was pending.
+    """
+    job = job_controller.claim_job(session)
+
+    if not job:
+        return None
+
+    def checkpoint() -> bool:
+        job_controller.renew_job(session, job)
+        return stop is not None and stop.is_set()
+
+    try:
+        handler = JOB_HANDLERS[job.kind]
+        result = handler(session, job.payload, checkpoint)
+    except JobInterrupted:
+        logger.info("Job %s (%s) interrupted, requeued", job.id, job.kind)
+        session.rollback()
+        job_controller.requeue_job(session, job)
+    except Exception as e:
+        logger.exception("Job %s (%s) failed", job.id, job.kind)
+        session.rollback()
+        job_controller.finish_job(session, job, error=str(e) or type(e).__name__)
+    else:
+        job_controller.finish_job(session, job, result=result)
+
+    return job
+
+
+class JobWorkerPool:
+    """Threads that run pending jobs from the job table.
+
+    Parameters:
+        engine (Engine): The database the job table lives in.
+        workers (int): How many jobs can run at the same time.
+        poll_interval (float): Seconds an idle worker waits before polling.
+        lease (timedelta): How long a job may stay running before it is
+            considered abandoned (its worker was killed) and run again. Idle
+            workers look for such jobs at most four times per lease.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        workers: int,
+        poll_interval: float = 1.0,
+        lease: timedelta = timedelta(hours=1),
+    ):
+        self.engine = engine
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._sweep_lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def _requeue_stale_jobs(self, session: Session) -> None:
+        # Requeuing is a write; doing it on every poll would take the write
+        # lock every poll_interval even when the queue is idle.
+        with self._sweep_lock:
+            now = time.monotonic()
+
+            if now < self._next_sweep:
+                return
+
+            self._next_sweep = now + self.lease.total_seconds() / 4
+
+        requeued = job_controller.requeue_stale_jobs(session, self.lease)
+
+        if requeued:
+            logger.warning("Requeued %s stale jobs", requeued)
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with Session(self.engine) as session:
+                    job = run_next_job(session, stop=self._stop)
+
+                    if not job:
+                        self._requeue_stale_jobs(session)
+            except Exception:
+                logger.exception("Job worker error")
+                job = None
+
+            if not job:
+                self._stop.wait(self.poll_interval)
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Stop polling and wait for the running jobs to stop.
+
+        Jobs that check the stop event are requeued where they stopped.
+        """
+        self._stop.set()
+
+        for thread in self._threads:
+            thread.join()
+
+        self._threads.clear()
+
+
+def create_job_worker_pool() -> JobWorkerPool:
+    """Create a pool of JOB_WORKERS (default 1) workers for the app database.
+
+    JOB_POLL_INTERVAL (default 1) and JOB_LEASE_SECONDS (default 3600) are in
+    seconds.
+    """
+    return JobWorkerPool(
+        get_engine(),
+        workers=int(os.environ.get("JOB_WORKERS", "1")),
+        poll_interval=float(os.environ.get("JOB_POLL_INTERVAL", "1")),
+        lease=timedelta(seconds=float(os.environ.get("JOB_LEASE_SECONDS", "3600"))),
+    )
+
+
+def run_job_workers(app: FastAPI) -> Generator[None, Any, None]:
+    """Run the job workers for as long as the app runs."""
+    pool = create_job_worker_pool()
+    pool.start()
+
+    try:
+        yield
+    finally:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    # Standalone workers, e.g. with JOB_WORKERS=0 in the API processes:
+    #     python -m src.core.jobs
+    logging.basicConfig(level=logging.INFO)
+
+    pool = create_job_worker_pool()
+    pool.start()
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pool.stop()
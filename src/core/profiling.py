@@ -0,0 +1,173 @@
+import cProfile
+import jwt
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+
+from functools import lru_cache
+from jwt.exceptions import InvalidTokenError
+from pathlib import Path
+
+from ..models.user import UserRole
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+class ProfileStore:
+    """Bounded on-disk ring buffer of pstats files.
+
+    Parameters:
+        directory (Path): Where the profiles are written.
+        max_files (int): How many profiles to keep; the oldest are removed.
+    """
+
+    def __init__(self, directory: Path, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def list(self) -> list[str]:
+        """List the stored profile names, newest first."""
+        if not self.directory.is_dir():
+            return []
+
+        return sorted(
+            (p.name for p in self.directory.glob("*.prof")), reverse=True
+        )
+
+    def path(self, name: str) -> Path | None:
+        """Get the path of a stored profile, or None if it does not exist."""
+        if name not in self.list():
+            return None
+
+        return self.directory / name
+
+    def new_name(self, method: str, path: str) -> str:
+        """Name a profile of a request before it is captured."""
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_") or "root"
+        return f"{time.time_ns()}-{method}-{slug}.prof"
+
+    def save(self, profiler: cProfile.Profile, name: str) -> None:
+        """Dump a profiler's stats and evict the oldest profiles."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.directory / name)
+
+            for old_name in self.list()[self.max_files :]:
+                (self.directory / old_name).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=None)
+def get_profile_store() -> ProfileStore:
+    """Get the profile store configured by PROFILING_DIR/PROFILING_MAX_FILES."""
+    directory = os.environ.get(
+        "PROFILING_DIR", os.path.join(tempfile.gettempdir(), "minerva-profiles")
+    )
+    max_files = int(os.environ.get("PROFILING_MAX_FILES", "50"))
+
+    return ProfileStore(Path(directory), max_files)
+
+
+def is_admin_token(authorization: str) -> bool:
+    """Check whether an Authorization header carries a valid admin JWT.
+
+    Only the token's `role` claim is checked, not the database, so a user
+    who was demoted or deleted can still trigger profiling until the token
+    expires (ACCESS_TOKEN_EXPIRE_MINUTES). Listing and downloading the
+    profiles does resolve the user and requires a current admin.
+    """
+    scheme, _, token = authorization.partition(" ")
+
+    if scheme.lower() != "bearer" or not token:
+        return False
+
+    try:
+        payload: dict = jwt.decode(
+            token,
+            os.environ.get("SECRET_KEY"),
+            algorithms=[os.environ.get("HASH_ALGORITHM")],
+        )
+    except InvalidTokenError:
+        return False
+
+    return payload.get("role") == UserRole.ADMIN
+
+
+class ProfilingMiddleware:
+    """Run selected requests under cProfile and store their stats.
+
+    A request is profiled when it sends `X-Profile: true` together with an
+    admin bearer token (see is_admin_token), or when it is picked by
+    `sample_rate`. Only one request is profiled at a time; concurrent
+    candidates run unprofiled. The response is passed through as it is sent,
+    with the profile name added to its headers, so streamed responses are not
+    buffered. The middleware is only installed when profiling is enabled, so
+    disabled deployments pay nothing for it.
+
+    cProfile only sees the event loop thread, which has two consequences:
+
+    - Work done in the threadpool is not captured. That includes sync (`def`)
+      routes and dependencies such as get_session, get_current_user and
+      get_admin_user. Their cost shows up only as the event loop idling
+      (for example in `select`) while the thread runs.
+    - Coroutines of other requests that run while the profiled request waits
+      are charged to its profile.
+
+    So the profile shows the async path of one request, plus some noise from
+    concurrent traffic. It is not a complete breakdown of where the request's
+    time goes.
+
+    Parameters:
+        app: The ASGI application to wrap.
+        store (ProfileStore): Where the profiles are written.
+        sample_rate (float): Fraction of requests profiled without the header.
+    """
+
+    def __init__(self, app, store: ProfileStore, sample_rate: float = 0.0):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self._busy = threading.Lock()
+
+    def _wants_profile(self, scope) -> bool:
+        headers = dict(scope["headers"])
+
+        if headers.get(PROFILE_HEADER, b"").lower() in (b"1", b"true"):
+            return is_admin_token(headers.get(b"authorization", b"").decode())
+
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = cProfile.Profile()
+        name = self.store.new_name(scope["method"], scope["path"])
+
+        async def profiled_send(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_ID_HEADER, name.encode()),
+                ]
+
+            await send(message)
+
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, profiled_send)
+            finally:
+                profiler.disable()
+                self.store.save(profiler, name)
+        finally:
+            self._busy.release()
@@ -0,0 +1,218 @@
+import json
+import jwt
+import math
+import os
+import time
+
+from collections import OrderedDict
+from jwt.exceptions import InvalidTokenError
+from pydantic import BaseModel
+
+
+class RateLimit(BaseModel):
+    """A token bucket allowing `capacity` requests every `period` seconds."""
+
+    method: str
+    path: str
+    capacity: int
+    period: float
+
+    def matches(self, method: str, path: str) -> bool:
+        return (self.method == "*" or self.method == method) and (
+            path == self.path or path.startswith(self.path.rstrip("/") + "/")
+        )
+
+
+DEFAULT_RATE_LIMITS = "POST /auth/login=10/60,* /users=120/60"
+
+
+def parse_rate_limits(config: str) -> list[RateLimit]:
+    """Parse a rate limit configuration.
+
+    Parameters:
+        config (str): Comma separated `METHOD /path=capacity/seconds` rules,
+            e.g. `POST /auth/login=10/60,* /users=120/60`. A rule applies to
+            its path and every path below it; the longest match wins.
+
+    Returns:
+        list[RateLimit]: The rules, most specific first.
+    """
+    limits = []
+
+    for rule in filter(None, (r.strip() for r in config.split(","))):
+        route, _, limit = rule.partition("=")
+        method, _, path = route.strip().partition(" ")
+        capacity, _, period = limit.partition("/")
+        limits.append(
+            RateLimit(
+                method=method.upper(),
+                path=path.strip(),
+                capacity=int(capacity),
+                period=float(period),
+            )
+        )
+
+    return sorted(limits, key=lambda limit: len(limit.path), reverse=True)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `capacity / period` tokens/s."""
+
+    __slots__ = ("capacity", "rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: int, period: float, now: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated_at = now
+
+    def acquire(self, now: float) -> float:
+        """Take a token.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is
+            available.
+        """
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimitMiddleware:
+    """Per principal rate limiting and global load shedding.
+
+    Requests matching a rule take a token from the bucket of their principal:
+    the JWT subject when a valid bearer token is sent, the client IP
+    otherwise. An empty bucket answers 429, and more than `max_in_flight`
+    concurrent requests answer 503, both with a Retry-After header.
+
+    The limiter is exposed to the app as `scope["rate_limiter"]` so requests
+    that fan out internally (POST /batch) can charge each operation.
+
+    Parameters:
+        app: The ASGI application to wrap.
+        limits (list[RateLimit]): The rules, most specific first.
+        max_in_flight (int): Concurrent requests allowed before shedding.
+        max_keys (int): Buckets kept in memory; least recently used go first.
+    """
+
+    def __init__(
+        self,
+        app,
+        limits: list[RateLimit],
+        max_in_flight: int = 64,
+        max_keys: int = 10_000,
+    ):
+        self.app = app
+        self.limits = limits
+        self.max_in_flight = max_in_flight
+        self.max_keys = max_keys
+        self.in_flight = 0
+        self._buckets: OrderedDict[tuple[int, str], TokenBucket] = OrderedDict()
+
+    def _principal(self, scope) -> str:
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode().partition(" ")
+
+                if scheme.lower() != "bearer":
+                    break
+
+                try:
+                    payload: dict = jwt.decode(
+                        token,
+                        os.environ.get("SECRET_KEY"),
+                        algorithms=[os.environ.get("HASH_ALGORITHM")],
+                    )
+                except InvalidTokenError:
+                    break
+
+                if payload.get("sub"):
+                    return f"sub:{payload['sub']}"
+
+                break
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    def acquire(self, scope) -> float:
+        """Take a token for a request from the bucket of its rule and principal.
+
+        Returns:
+            float: 0 if the request is admitted, otherwise the seconds until
+            it would be.
+        """
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+
+        for index, limit in enumerate(self.limits):
+            if limit.matches(scope["method"], path):
+                break
+        else:
+            return 0.0
+
+        now = time.monotonic()
+        key = (index, self._principal(scope))
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(
+                limit.capacity, limit.period, now
+            )
+
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        return bucket.acquire(now)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.in_flight >= self.max_in_flight:
+            await _reject(send, 503, "Server is overloaded", 1)
+            return
+
+        retry_after = self.acquire(scope)
+
+        if retry_after:
+            await _reject(send, 429, "Too many requests", retry_after)
+            return
+
+        scope["rate_limiter"] = self
+        self.in_flight += 1
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+
+async def _reject(send, status_code: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}).encode()
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
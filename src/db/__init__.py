@@ -1 +1 @@
-from .database import create_all_tables, get_session
+from .database import create_all_tables, get_engine, get_session
@@ -1,34 +1,131 @@
 import os
 
-from fastapi import FastAPI
-from sqlmodel import SQLModel, Session, create_engine
+from fastapi import FastAPI, Request
+from functools import lru_cache
+from sqlmodel import Field, SQLModel, Session, create_engine, select
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 from typing import Any, Generator
 
 from src.core import load_env_file
+from src.db.migrations import run_migrations
 
-load_env_file()
+# Bump whenever the schema changes. New tables only need the bump (create_all
+# creates them); changes to existing tables also need a step in MIGRATIONS.
+SCHEMA_VERSION = 4
 
-engine: Engine
 
-match os.environ.get("ENVIRONMENT"):
-    case "development":
-        DATABASE_URL = os.environ.get("DATABSE_URL")
-        engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-    case "production":
-        DATABASE_URL = os.environ.get("DATABSE_URL")
-        engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-    case _:
-        raise ValueError("Invalid environment")
+class SchemaVersion(SQLModel, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+    version: int = Field()
+
+
+def _is_sqlite(dbapi_connection) -> bool:
+    return type(dbapi_connection).__module__.startswith("sqlite3")
+
+
+@event.listens_for(Engine, "connect")
+def configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Enable foreign keys (and ON DELETE CASCADE) on SQLite.
+
+    The driver's own transaction handling is also turned off so SQLAlchemy
+    emits BEGIN itself, which SAVEPOINTs need to work.
+    """
+    if _is_sqlite(dbapi_connection):
+        dbapi_connection.isolation_level = None
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+@event.listens_for(Engine, "begin")
+def begin_sqlite_transaction(connection) -> None:
+    if _is_sqlite(connection.connection.dbapi_connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Build the database engine on first use."""
+    load_env_file()
+
+    match os.environ.get("ENVIRONMENT"):
+        case "development":
+            DATABASE_URL = os.environ.get("DATABSE_URL")
+            return create_engine(
+                DATABASE_URL, connect_args={"check_same_thread": False}
+            )
+        case "production":
+            DATABASE_URL = os.environ.get("DATABSE_URL")
+            return create_engine(
+                DATABASE_URL, connect_args={"check_same_thread": False}
+            )
+        case _:
+            raise ValueError("Invalid environment")
+
+
+def get_schema_version(engine: Engine) -> int | None:
+    """Get the stored schema version, or None for databases without one."""
+    try:
+        with Session(engine) as session:
+            return session.exec(select(SchemaVersion.version)).first()
+    except DBAPIError:
+        return None
+
+
+def upgrade_schema(engine: Engine, from_version: int | None) -> None:
+    """Create missing tables, run the pending migrations and store the version.
+
+    Everything runs in one transaction, so a failed upgrade leaves the
+    database as it was.
+    """
+    with Session(engine) as session:
+        connection = session.connection()
+
+        SQLModel.metadata.create_all(connection)
+        run_migrations(connection, from_version)
+
+        schema_version = session.exec(select(SchemaVersion)).first()
+
+        if not schema_version:
+            schema_version = SchemaVersion(version=SCHEMA_VERSION)
+
+        schema_version.version = SCHEMA_VERSION
+
+        session.add(schema_version)
+        session.commit()
 
 
 def create_all_tables(app: FastAPI) -> Generator[None, Any, None]:
-    """Create all tables in the database."""
-    SQLModel.metadata.create_all(engine)
+    """Create all tables in the database and upgrade existing ones.
+
+    With FAST_START=true the upgrade (create_all and the migrations) is
+    skipped when the stored schema version already matches SCHEMA_VERSION;
+    any other version, or none, runs it. That saves the upgrade's reflection
+    queries, which matters on a networked database; on a local SQLite file
+    it saves only a few milliseconds.
+    """
+    engine = get_engine()
+    version = get_schema_version(engine)
+
+    if os.environ.get("FAST_START") != "true" or version != SCHEMA_VERSION:
+        upgrade_schema(engine, version)
+
     yield
 
 
-def get_session():
-    """Get a session for the database."""
-    with Session(engine) as session:
+def get_session(request: Request):
+    """Get a session for the database.
+
+    Batch sub-requests share the session opened by the batch request.
+    """
+    batch_session = getattr(request.state, "batch_session", None)
+
+    if batch_session is not None:
+        yield batch_session
+        return
+
+    with Session(get_engine()) as session:
         yield session
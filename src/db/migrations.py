@@ -0,0 +1,119 @@
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from typing import Callable
+
+from ..models.task import Task
+
+logger = logging.getLogger(__name__)
+
+
+def _quote(connection: Connection, name: str) -> str:
+    return connection.dialect.identifier_preparer.quote(name)
+
+
+def _columns(connection: Connection, table: str) -> set[str]:
+    return {column["name"] for column in inspect(connection).get_columns(table)}
+
+
+def add_user_is_deleted(connection: Connection) -> None:
+    """Add the User.is_deleted tombstone flag."""
+    if "is_deleted" in _columns(connection, "user"):
+        return
+
+    connection.exec_driver_sql(
+        f"ALTER TABLE {_quote(connection, 'user')} "
+        "ADD COLUMN is_deleted BOOLEAN NOT NULL DEFAULT FALSE"
+    )
+
+
+def cascade_task_user_id(connection: Connection) -> None:
+    """Make Task.user_id ON DELETE CASCADE.
+
+    SQLite cannot alter a foreign key, so the task table is rebuilt from the
+    current model there. Tasks of users that no longer exist cannot satisfy
+    the enforced foreign key and are dropped.
+    """
+    foreign_keys = inspect(connection).get_foreign_keys("task")
+    user_fk = next(fk for fk in foreign_keys if fk["referred_table"] == "user")
+
+    if (user_fk["options"].get("ondelete") or "").upper() == "CASCADE":
+        return
+
+    task, user = _quote(connection, "task"), _quote(connection, "user")
+
+    if connection.dialect.name != "sqlite":
+        name = _quote(connection, user_fk["name"])
+        connection.exec_driver_sql(
+            f"ALTER TABLE {task} DROP CONSTRAINT {name}, "
+            f"ADD CONSTRAINT {name} FOREIGN KEY (user_id) "
+            f"REFERENCES {user} (id) ON DELETE CASCADE"
+        )
+        return
+
+    columns = ", ".join(
+        _quote(connection, column)
+        for column in _columns(connection, "task") & set(Task.__table__.columns.keys())
+    )
+
+    connection.exec_driver_sql(f"ALTER TABLE {task} RENAME TO task_old")
+    Task.__table__.create(connection)
+    inserted = connection.exec_driver_sql(
+        f"INSERT INTO {task} ({columns}) SELECT {columns} FROM task_old "
+        f"WHERE user_id IN (SELECT id FROM {user})"
+    ).rowcount
+    orphans = connection.exec_driver_sql("SELECT count(*) FROM task_old").scalar()
+    connection.exec_driver_sql("DROP TABLE task_old")
+
+    if orphans != inserted:
+        logger.warning("Dropped %s tasks of deleted users", orphans - inserted)
+
+
+def add_user_task_count(connection: Connection) -> None:
+    """Add User.task_count and fill it from the task table."""
+    user = _quote(connection, "user")
+
+    if "task_count" not in _columns(connection, "user"):
+        connection.exec_driver_sql(
+            f"ALTER TABLE {user} ADD COLUMN task_count INTEGER NOT NULL DEFAULT 0"
+        )
+
+    connection.exec_driver_sql(
+        f"UPDATE {user} SET task_count = "
+        f"(SELECT count(*) FROM task WHERE task.user_id = {user}.id)"
+    )
+
+
+def index_task_user_id(connection: Connection) -> None:
+    """Index Task.user_id."""
+    for index in Task.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
+def upgrade_to_2(connection: Connection) -> None:
+    add_user_is_deleted(connection)
+    cascade_task_user_id(connection)
+
+
+def upgrade_to_3(connection: Connection) -> None:
+    add_user_task_count(connection)
+    index_task_user_id(connection)
+
+
+# Upgrade steps by the SCHEMA_VERSION that introduced them. create_all only
+# creates missing tables, so every change to an existing table needs a step
+# here. Steps are idempotent: they also run on databases create_all has just
+# built.
+MIGRATIONS: dict[int, Callable[[Connection], None]] = {
+    2: upgrade_to_2,
+    3: upgrade_to_3,
+}
+
+
+def run_migrations(connection: Connection, from_version: int | None) -> None:
+    """Run the upgrade steps newer than `from_version` (None: all of them)."""
+    for version in sorted(MIGRATIONS):
+        if from_version is None or version > from_version:
+            logger.info("Upgrading database schema to version %s", version)
+            MIGRATIONS[version](connection)
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Any, List, Literal
+
+
+class BatchOperation(BaseModel):
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    path: str
+    body: Any | None = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchOperation]
+    transaction: bool = False
+
+
+class BatchResponse(BaseModel):
+    status: int
+    body: Any | None = None
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from enum import Enum
+from sqlmodel import JSON, Field, SQLModel
+from typing import Any
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobBase(SQLModel):
+    kind: str = Field(max_length=255, nullable=False)
+    payload: dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
+    status: JobStatus = Field(default=JobStatus.PENDING, index=True)
+    result: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    error: str | None = Field(default=None)
+
+    # Not a foreign key: a job may outlive the user that created it.
+    user_id: int | None = Field(default=None)
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Renewed at each checkpoint of a running job; it is the job's lease.
+    started_at: datetime | None = Field(default=None)
+    finished_at: datetime | None = Field(default=None)
+
+
+class Job(JobBase, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+
+
+class JobRead(JobBase):
+    id: int
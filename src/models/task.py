@@ -1,5 +1,5 @@
 from sqlmodel import Field, Relationship, SQLModel
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .user import User
@@ -9,7 +9,7 @@ class TaskBase(SQLModel):
     title: str = Field(nullable=False)
     description: str | None = Field(default=None)
 
-    user_id: int = Field(foreign_key="user.id")
+    user_id: int = Field(foreign_key="user.id", ondelete="CASCADE", index=True)
 
 
 class Task(TaskBase, table=True):
@@ -29,3 +29,33 @@ class TaskRead(TaskBase):
 class TaskUpdate(SQLModel):
     title: str | None = None
     description: str | None = None
+
+
+class UserTaskCount(SQLModel):
+    user_id: int
+    task_count: int
+
+
+class TaskStats(SQLModel):
+    total_users: int
+    total_tasks: int
+    users: List[UserTaskCount]
+
+
+class TaskImportError(SQLModel):
+    line: int
+    error: str
+
+
+class TaskImportChunk(SQLModel):
+    chunk: int
+    inserted: int
+    failed: int
+    errors: List[TaskImportError]
+
+
+class TaskImportReport(SQLModel):
+    inserted: int
+    failed: int
+    chunk_count: int
+    chunks: List[TaskImportChunk]
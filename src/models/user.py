@@ -21,8 +21,12 @@ class UserBase(SQLModel):
 class User(UserBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
     password: str = Field()
+    is_deleted: bool = Field(default=False)
+    task_count: int = Field(default=0)
 
-    tasks: List["Task"] = Relationship(back_populates="user")
+    tasks: List["Task"] = Relationship(
+        back_populates="user", cascade_delete=True, passive_deletes=True
+    )
 
 
 class UserCreate(UserBase):
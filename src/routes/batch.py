@@ -0,0 +1,163 @@
+import json
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlmodel import Session
+from typing import List
+
+from ..db import get_session
+from ..dependencies.user import CurrentUserDep
+from ..models.batch import BatchOperation, BatchRequest, BatchResponse
+
+
+router = APIRouter(
+    tags=["batch"],
+)
+
+
+def _operation_scope(request: Request, operation: BatchOperation, state: dict):
+    path, _, query_string = operation.path.partition("?")
+    full_path = request.scope.get("root_path", "") + path
+    headers = [
+        (name, value)
+        for name, value in request.scope["headers"]
+        if name == b"authorization"
+    ]
+
+    scope = {
+        key: value
+        for key, value in request.scope.items()
+        if key not in ("route", "endpoint", "path_params")
+    }
+    scope.update(
+        method=operation.method,
+        path=full_path,
+        raw_path=full_path.encode(),
+        query_string=query_string.encode(),
+        headers=headers,
+        state=state,
+    )
+
+    return scope
+
+
+async def _run_operation(
+    request: Request, operation: BatchOperation, state: dict
+) -> BatchResponse:
+    """Run one operation through the app's router, skipping the middleware.
+
+    Each operation takes its own token from the rate limiter, if one is
+    installed, so a batch is limited like the requests it replaces.
+    """
+    scope = _operation_scope(request, operation, state)
+    limiter = request.scope.get("rate_limiter")
+
+    if limiter and limiter.acquire(scope):
+        return BatchResponse(
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            body={"detail": "Too many requests"},
+        )
+
+    body = b"" if operation.body is None else json.dumps(operation.body).encode()
+    scope["headers"] = [
+        *scope["headers"],
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    response_body = bytearray()
+
+    async def send(message):
+        nonlocal response_status
+
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+        elif message["type"] == "http.response.body":
+            response_body.extend(message.get("body", b""))
+
+    await request.app.router(scope, receive, send)
+
+    try:
+        content = json.loads(response_body) if response_body else None
+    except ValueError:
+        content = response_body.decode(errors="replace")
+
+    return BatchResponse(status=response_status, body=content)
+
+
+@router.post("/batch")
+async def batch(
+    *,
+    request: Request,
+    session: Session = Depends(get_session),
+    batch_data: BatchRequest,
+    current_user: CurrentUserDep
+) -> List[BatchResponse]:
+    """Run several API operations in one round trip.
+
+    The caller is authenticated once and every operation shares one database
+    session. With `transaction=true` the operations run in a single
+    transaction that is rolled back if any of them fails.
+    """
+    max_requests = int(os.environ.get("BATCH_MAX_REQUESTS", "20"))
+
+    if len(batch_data.requests) > max_requests:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch cannot contain more than {max_requests} requests",
+        )
+
+    for operation in batch_data.requests:
+        if not operation.path.startswith("/") or operation.path.startswith(
+            "/batch"
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid batch path: {operation.path}",
+            )
+
+    if not batch_data.transaction:
+        state = {"batch_session": session, "batch_user": current_user}
+        return [
+            await _run_operation(request, operation, state)
+            for operation in batch_data.requests
+        ]
+
+    # The controllers commit on their own; binding the session to an outer
+    # transaction turns those commits into savepoints. The request session is
+    # closed first so it holds no locks while the transaction runs.
+    session.close()
+
+    with session.get_bind().connect() as connection:
+        transaction = connection.begin()
+        transaction_session = Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        state = {"batch_session": transaction_session, "batch_user": current_user}
+        responses = []
+
+        try:
+            for operation in batch_data.requests:
+                response = await _run_operation(request, operation, state)
+                responses.append(response)
+
+                if response.status >= status.HTTP_400_BAD_REQUEST:
+                    break
+
+            transaction_session.close()
+
+            if responses and responses[-1].status < status.HTTP_400_BAD_REQUEST:
+                transaction.commit()
+        finally:
+            # Reached with the transaction still open when an operation failed
+            # or raised.
+            transaction_session.close()
+
+            if transaction.is_active:
+                transaction.rollback()
+
+    return responses
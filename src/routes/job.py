@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import Session
+from typing import List
+
+from ..db import get_session
+from ..controllers import job as job_controller
+from ..dependencies.user import AdminUserDep, CurrentUserDep
+from ..models.job import JobRead, JobStatus
+from ..models.user import UserRole
+
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+)
+
+
+@router.get("/", tags=["admin"])
+async def get_jobs(
+    *,
+    session: Session = Depends(get_session),
+    job_status: JobStatus | None = Query(default=None, alias="status"),
+    _: AdminUserDep
+) -> List[JobRead]:
+    """Get all jobs, optionally filtered by status."""
+    return job_controller.get_jobs(session=session, status=job_status)
+
+
+@router.get("/{job_id}")
+async def get_job(
+    *,
+    session: Session = Depends(get_session),
+    job_id: int,
+    current_user: CurrentUserDep
+) -> JobRead:
+    """Get a job by ID. Users can only see the jobs they started."""
+    job = job_controller.get_job(session=session, job_id=job_id)
+
+    if isinstance(job, str):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=job)
+    elif not job or (
+        current_user.role != UserRole.ADMIN and job.user_id != current_user.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+
+    return job
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+from typing import List
+
+from ..core.profiling import get_profile_store
+from ..dependencies.user import AdminUserDep
+
+
+router = APIRouter(
+    prefix="/profiles",
+    tags=["admin"],
+)
+
+
+@router.get("/")
+async def get_profiles(*, _: AdminUserDep) -> List[str]:
+    """List the captured profiles, newest first."""
+    return get_profile_store().list()
+
+
+@router.get("/{name}")
+async def get_profile(*, name: str, _: AdminUserDep) -> FileResponse:
+    """Download a captured profile as a pstats file."""
+    path = get_profile_store().path(name)
+
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
@@ -0,0 +1,88 @@
+import csv
+import io
+
+from fastapi import APIRouter, Depends, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from typing import Iterator, Literal
+
+from ..db import get_session
+from ..controllers import task as task_controller
+from ..dependencies.user import AdminUserDep
+from ..models.task import TaskImportReport, TaskRead
+
+
+router = APIRouter(
+    prefix="/tasks",
+    tags=["admin"],
+)
+
+EXPORT_FIELDS = list(TaskRead.model_fields)
+
+
+def _export_rows(bind: Engine, format: Literal["csv", "ndjson"]) -> Iterator[str]:
+    # The response is streamed after the request's dependencies have exited,
+    # so the export reads through its own session.
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+
+    if format == "csv":
+        writer.writeheader()
+
+    with Session(bind) as session:
+        for tasks in task_controller.export_tasks(session=session):
+            for task in tasks:
+                task_data = TaskRead.model_validate(task)
+
+                if format == "csv":
+                    writer.writerow(task_data.model_dump())
+                else:
+                    buffer.write(task_data.model_dump_json() + "\n")
+
+            yield buffer.getvalue()
+
+            buffer.seek(0)
+            buffer.truncate()
+
+
+# A plain function so the (blocking) file parsing runs in the threadpool.
+@router.post("/import")
+def import_tasks(
+    *,
+    session: Session = Depends(get_session),
+    file: UploadFile,
+    format: Literal["csv", "ndjson"] | None = None,
+    _: AdminUserDep
+) -> TaskImportReport:
+    """Import tasks from a CSV or NDJSON upload.
+
+    The format defaults to the file extension (.ndjson/.jsonl, otherwise CSV).
+    Rows are imported in independently committed chunks and the report lists
+    the result of each chunk.
+    """
+    if format is None:
+        is_ndjson = (file.filename or "").endswith((".ndjson", ".jsonl"))
+        format = "ndjson" if is_ndjson else "csv"
+
+    rows = task_controller.read_task_rows(file.file, format)
+
+    return task_controller.import_tasks(session=session, rows=rows)
+
+
+@router.get("/export")
+async def export_tasks(
+    *,
+    session: Session = Depends(get_session),
+    format: Literal["csv", "ndjson"] = "csv",
+    _: AdminUserDep
+) -> StreamingResponse:
+    """Stream every task as CSV or NDJSON."""
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    session.close()
+
+    return StreamingResponse(
+        _export_rows(session.get_bind(), format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=tasks.{format}"},
+    )
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 from sqlmodel import Session
-from typing import List
+from typing import List, Literal
 
 from ..db import get_session
 from ..controllers import user as user_controller, task as task_controller
 from ..dependencies.user import AdminUserDep, CurrentUserDep
+from ..models.job import JobRead
 from ..models.user import UserCreate, UserRead, UserUpdate
-from ..models.task import TaskCreate, TaskRead, TaskUpdate
+from ..models.task import TaskCreate, TaskRead, TaskStats, TaskUpdate
 
 
 router = APIRouter(
@@ -14,6 +16,30 @@ router = APIRouter(
 )
 
 
+def _delete_user(
+    session: Session, user_id: int, background: bool, requested_by: int
+) -> JSONResponse | None:
+    if background:
+        user = user_controller.tombstone_user(
+            session=session, user_id=user_id, requested_by=requested_by
+        )
+    else:
+        user = user_controller.delete_user(session=session, user_id=user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    elif isinstance(user, str):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=user)
+
+    if background:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=JobRead.model_validate(user).model_dump(mode="json"),
+        )
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED, tags=["signup"])
 async def create_user(
     *, session: Session = Depends(get_session), user_data: UserCreate
@@ -35,12 +61,23 @@ async def get_users(
     return user_controller.get_users(session=session)
 
 
-@router.get("/{user_id}", tags=["admin"])
+@router.get("/stats", tags=["admin"])
+async def get_task_stats(
+    *,
+    session: Session = Depends(get_session),
+    source: Literal["aggregate", "counters"] = "aggregate",
+    _: AdminUserDep
+) -> TaskStats:
+    """Get task counts per user and global totals."""
+    return task_controller.get_task_stats(session=session, source=source)
+
+
+@router.get("/me", tags=["users"])
 async def get_user(
-    *, session: Session = Depends(get_session), user_id: int, _: AdminUserDep
+    *, session: Session = Depends(get_session), current_user: CurrentUserDep
 ) -> UserRead:
-    """Get a user by ID."""
-    user = user_controller.get_user(session=session, user_id=user_id)
+    """Get the current user."""
+    user = user_controller.get_user(session=session, user_id=current_user.id)
 
     if not user:
         raise HTTPException(
@@ -52,17 +89,16 @@ async def get_user(
     return user
 
 
-@router.put("/{user_id}", tags=["admin"])
-async def update_user(
+@router.put("/me", tags=["users"])
+async def update_current_user(
     *,
     session: Session = Depends(get_session),
-    user_id: int,
     user_data: UserUpdate,
-    _: AdminUserDep
+    current_user: CurrentUserDep
 ) -> UserRead:
-    """Update a user."""
+    """Update the current user."""
     user = user_controller.update_user(
-        session=session, user_id=user_id, user_data=user_data
+        session=session, user_id=current_user.id, user_data=user_data
     )
 
     if not user:
@@ -75,27 +111,32 @@ async def update_user(
     return user
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["admin"])
-async def delete_user(
-    *, session: Session = Depends(get_session), user_id: int, _: AdminUserDep
+@router.delete(
+    "/me",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobRead}},
+    tags=["users"],
+)
+async def delete_current_user(
+    *,
+    session: Session = Depends(get_session),
+    background: bool = False,
+    current_user: CurrentUserDep
 ) -> None:
-    """Delete a user."""
-    user = user_controller.delete_user(session=session, user_id=user_id)
+    """Delete the current user.
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
-    elif isinstance(user, str):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=user)
+    With `background=true` the user is tombstoned right away and a job that
+    purges their tasks in chunks is returned (202 Accepted).
+    """
+    return _delete_user(session, current_user.id, background, current_user.id)
 
 
-@router.get("/me", tags=["users"])
+@router.get("/{user_id}", tags=["admin"])
 async def get_user(
-    *, session: Session = Depends(get_session), current_user: CurrentUserDep
+    *, session: Session = Depends(get_session), user_id: int, _: AdminUserDep
 ) -> UserRead:
-    """Get the current user."""
-    user = user_controller.get_user(session=session, user_id=current_user.id)
+    """Get a user by ID."""
+    user = user_controller.get_user(session=session, user_id=user_id)
 
     if not user:
         raise HTTPException(
@@ -107,16 +148,17 @@ async def get_user(
     return user
 
 
-@router.put("/me", tags=["users"])
-async def update_current_user(
+@router.put("/{user_id}", tags=["admin"])
+async def update_user(
     *,
     session: Session = Depends(get_session),
+    user_id: int,
     user_data: UserUpdate,
-    current_user: CurrentUserDep
+    _: AdminUserDep
 ) -> UserRead:
-    """Update the current user."""
+    """Update a user."""
     user = user_controller.update_user(
-        session=session, user_id=current_user.id, user_data=user_data
+        session=session, user_id=user_id, user_data=user_data
     )
 
     if not user:
@@ -129,19 +171,25 @@ async def update_current_user(
     return user
 
 
-@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT, tags=["users"])
-async def delete_current_user(
-    *, session: Session = Depends(get_session), current_user: CurrentUserDep
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobRead}},
+    tags=["admin"],
+)
+async def delete_user(
+    *,
+    session: Session = Depends(get_session),
+    user_id: int,
+    background: bool = False,
+    current_user: AdminUserDep
 ) -> None:
-    """Delete the current user."""
-    user = user_controller.delete_user(session=session, user_id=current_user.id)
+    """Delete a user.
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
-    elif isinstance(user, str):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=user)
+    With `background=true` the user is tombstoned right away and a job that
+    purges their tasks in chunks is returned (202 Accepted).
+    """
+    return _delete_user(session, user_id, background, current_user.id)
 
 
 @router.post("/me/tasks", status_code=status.HTTP_201_CREATED, tags=["tasks"])
@@ -0,0 +1,149 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.rate_limit import RateLimitMiddleware, parse_rate_limits
+
+
+def test_batch(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    user_id, headers = login()
+    task_data = {"title": "Task", "user_id": user_id}
+
+    response = client.post(
+        f"{endpoint}/batch",
+        json={
+            "requests": [
+                {"method": "POST", "path": "/users/me/tasks", "body": task_data},
+                {"method": "GET", "path": "/users/me"},
+                {"method": "GET", "path": "/users/me/tasks"},
+                {"method": "GET", "path": "/users/me/tasks/1"},
+                {"method": "GET", "path": "/users/me/tasks/2"},
+                {"method": "GET", "path": "/users/"},
+            ]
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [r["status"] for r in response.json()] == [201, 200, 200, 200, 404, 403]
+    assert response.json()[1]["body"]["email"] == "user@mail.com"
+    assert response.json()[2]["body"][0]["title"] == "Task"
+
+
+def test_batch_requires_authentication(client: TestClient):
+    response = client.post(
+        "/api/v1/batch", json={"requests": [{"method": "GET", "path": "/users/me"}]}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_batch_limits(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    _, headers = login()
+    operation = {"method": "GET", "path": "/users/me"}
+
+    too_many = client.post(
+        f"{endpoint}/batch", json={"requests": [operation] * 21}, headers=headers
+    )
+    nested = client.post(
+        f"{endpoint}/batch",
+        json={"requests": [{"method": "POST", "path": "/batch"}]},
+        headers=headers,
+    )
+
+    assert too_many.status_code == status.HTTP_400_BAD_REQUEST
+    assert nested.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_batch_charges_rate_limit_per_operation(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    _, headers = login()
+    limits = parse_rate_limits("* /users=2/60")
+    limited_client = TestClient(
+        RateLimitMiddleware(app, limits=limits), root_path=endpoint
+    )
+    operation = {"method": "GET", "path": "/users/me/tasks"}
+
+    response = limited_client.post(
+        f"{endpoint}/batch", json={"requests": [operation] * 3}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [r["status"] for r in response.json()] == [200, 200, 429]
+    assert (
+        limited_client.get(f"{endpoint}/users/me/tasks", headers=headers).status_code
+        == status.HTTP_429_TOO_MANY_REQUESTS
+    )
+
+
+def test_batch_transaction_rolls_back_on_failure(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    user_id, headers = login()
+    task_data = {"title": "Task", "user_id": user_id}
+
+    response = client.post(
+        f"{endpoint}/batch",
+        json={
+            "transaction": True,
+            "requests": [
+                {"method": "POST", "path": "/users/me/tasks", "body": task_data},
+                {"method": "GET", "path": "/users/me/tasks/999"},
+                {"method": "GET", "path": "/users/me/tasks"},
+            ],
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [r["status"] for r in response.json()] == [201, 404]
+    assert client.get(f"{endpoint}/users/me/tasks", headers=headers).json() == []
+
+
+def test_batch_transaction_rolls_back_on_error(client: TestClient, login, monkeypatch):
+    endpoint: str = "/api/v1"
+    user_id, headers = login()
+    task_data = {"title": "Task", "user_id": user_id}
+    monkeypatch.setattr("src.controllers.task.get_tasks", lambda **_: 1 / 0)
+
+    response = TestClient(app, raise_server_exceptions=False).post(
+        f"{endpoint}/batch",
+        json={
+            "transaction": True,
+            "requests": [
+                {"method": "POST", "path": "/users/me/tasks", "body": task_data},
+                {"method": "GET", "path": "/users/me/tasks"},
+            ],
+        },
+        headers=headers,
+    )
+    monkeypatch.undo()
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert client.get(f"{endpoint}/users/me/tasks", headers=headers).json() == []
+
+
+def test_batch_transaction_commits(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    user_id, headers = login()
+    task_data = {"title": "Task", "user_id": user_id}
+
+    response = client.post(
+        f"{endpoint}/batch",
+        json={
+            "transaction": True,
+            "requests": [
+                {"method": "POST", "path": "/users/me/tasks", "body": task_data},
+                {"method": "POST", "path": "/users/me/tasks", "body": task_data},
+                {"method": "GET", "path": "/users/me/tasks"},
+            ],
+        },
+        headers=headers,
+    )
+
+    assert [r["status"] for r in response.json()] == [201, 201, 200]
+    assert len(response.json()[2]["body"]) == 2
+
+    tasks = client.get(f"{endpoint}/users/me/tasks", headers=headers).json()
+    assert [task["id"] for task in tasks] == [1, 2]
@@ -0,0 +1,114 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlmodel import Session, update
+
+from src.controllers import job as job_controller, user as user_controller
+from src.core.jobs import JOB_HANDLERS, JobWorkerPool, run_next_job
+from src.models.job import Job, JobStatus
+from src.models.user import User
+
+
+def test_run_next_job(session: Session, monkeypatch):
+    monkeypatch.setitem(JOB_HANDLERS, "echo", lambda session, payload, _: payload)
+    monkeypatch.setitem(JOB_HANDLERS, "fail", lambda session, payload, _: 1 / 0)
+
+    first = job_controller.create_job(session, "echo", {"value": 1})
+    second = job_controller.create_job(session, "fail", {})
+
+    assert run_next_job(session).id == first.id
+    assert run_next_job(session).id == second.id
+    assert run_next_job(session) is None
+
+    assert first.status == JobStatus.SUCCEEDED
+    assert first.result == {"value": 1}
+    assert second.status == JobStatus.FAILED
+    assert second.error == "division by zero"
+
+
+def test_requeue_jobs(session: Session, monkeypatch):
+    monkeypatch.setitem(JOB_HANDLERS, "echo", lambda session, payload, _: payload)
+    stale = job_controller.create_job(session, "echo", {})
+    stale.status = JobStatus.RUNNING
+    stale.started_at = datetime.now(timezone.utc) - timedelta(hours=2)
+    session.add(stale)
+    session.commit()
+
+    assert job_controller.requeue_stale_jobs(session, timedelta(hours=3)) == 0
+    assert run_next_job(session) is None
+
+    pool = JobWorkerPool(session.get_bind(), workers=1, lease=timedelta(hours=1))
+    pool._requeue_stale_jobs(session)
+
+    assert run_next_job(session).id == stale.id
+    assert stale.status == JobStatus.SUCCEEDED
+
+    # Idle workers sweep at most four times per lease.
+    stale.status = JobStatus.RUNNING
+    stale.started_at = datetime.now(timezone.utc) - timedelta(hours=2)
+    session.add(stale)
+    session.commit()
+    pool._requeue_stale_jobs(session)
+
+    assert run_next_job(session) is None
+
+    stop = threading.Event()
+    stop.set()
+    user = User(
+        name="John Doe", email="user@mail.com", role="user", password="password"
+    )
+    session.add(user)
+    session.commit()
+    user_id = user.id
+    purge = user_controller.tombstone_user(session, user_id)
+
+    assert run_next_job(session, stop=stop).id == purge.id
+    assert purge.status == JobStatus.PENDING
+    assert purge.started_at is None
+    assert session.get(User, user_id) is not None
+
+    assert run_next_job(session).id == purge.id
+    assert purge.status == JobStatus.SUCCEEDED
+    assert session.get(User, user_id) is None
+
+
+def test_checkpoint_renews_lease(session: Session, monkeypatch):
+    lease = timedelta(hours=1)
+
+    def slow(session: Session, payload: dict, checkpoint) -> dict:
+        # The job has now been running for longer than its lease...
+        expired = datetime.now(timezone.utc) - 2 * lease
+        session.exec(update(Job).values(started_at=expired))
+        checkpoint()
+        # ...but the checkpoint renewed it.
+        return {"requeued": job_controller.requeue_stale_jobs(session, lease)}
+
+    monkeypatch.setitem(JOB_HANDLERS, "slow", slow)
+    job_controller.create_job(session, "slow", {})
+
+    assert run_next_job(session).result == {"requeued": 0}
+
+
+def test_get_jobs(client: TestClient, session: Session, login):
+    endpoint: str = "/api/v1"
+    admin_id, admin_headers = login("admin")
+    user_id, user_headers = login()
+    admin_job = job_controller.create_job(session, "echo", {}, user_id=admin_id)
+    user_job = job_controller.create_job(session, "echo", {}, user_id=user_id)
+
+    jobs = client.get(f"{endpoint}/jobs/", headers=admin_headers)
+    running = client.get(
+        f"{endpoint}/jobs/", params={"status": "running"}, headers=admin_headers
+    )
+    own_job = client.get(f"{endpoint}/jobs/{user_job.id}", headers=user_headers)
+    other_job = client.get(f"{endpoint}/jobs/{admin_job.id}", headers=user_headers)
+
+    assert [job["id"] for job in jobs.json()] == [user_job.id, admin_job.id]
+    assert running.json() == []
+    assert own_job.status_code == status.HTTP_200_OK
+    assert other_job.status_code == status.HTTP_404_NOT_FOUND
+    assert (
+        client.get(f"{endpoint}/jobs/", headers=user_headers).status_code
+        == status.HTTP_403_FORBIDDEN
+    )
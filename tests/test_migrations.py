@@ -0,0 +1,76 @@
+from sqlalchemy import inspect
+from sqlalchemy.pool import StaticPool
+from sqlmodel import create_engine
+
+from src.db.database import SCHEMA_VERSION, get_schema_version, upgrade_schema
+
+# The schema created by create_all before the schema was versioned.
+BASELINE_SCHEMA = [
+    """CREATE TABLE user (
+        name VARCHAR(255) NOT NULL,
+        email VARCHAR(255) NOT NULL,
+        role VARCHAR(5) NOT NULL,
+        id INTEGER NOT NULL,
+        password VARCHAR NOT NULL,
+        PRIMARY KEY (id)
+    )""",
+    "CREATE UNIQUE INDEX ix_user_email ON user (email)",
+    """CREATE TABLE task (
+        title VARCHAR NOT NULL,
+        description VARCHAR,
+        user_id INTEGER NOT NULL,
+        id INTEGER NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(user_id) REFERENCES user (id)
+    )""",
+    "INSERT INTO user VALUES ('John', 'john@mail.com', 'USER', 1, 'hash')",
+    "INSERT INTO task VALUES ('Task 1', NULL, 1, 1)",
+    "INSERT INTO task VALUES ('Task 2', 'Second', 1, 2)",
+]
+
+
+def _baseline_engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+    with engine.begin() as connection:
+        for statement in BASELINE_SCHEMA:
+            connection.exec_driver_sql(statement)
+
+    return engine
+
+
+def test_upgrade_baseline_schema():
+    engine = _baseline_engine()
+
+    assert get_schema_version(engine) is None
+
+    upgrade_schema(engine, None)
+
+    assert get_schema_version(engine) == SCHEMA_VERSION
+
+    with engine.begin() as connection:
+        columns = {c["name"] for c in inspect(connection).get_columns("user")}
+        (fk,) = inspect(connection).get_foreign_keys("task")
+
+        assert {"is_deleted", "task_count"} <= columns
+        assert connection.exec_driver_sql(
+            "SELECT task_count FROM user WHERE id = 1"
+        ).scalar() == 2
+        assert fk["options"]["ondelete"] == "CASCADE"
+        assert connection.exec_driver_sql("SELECT count(*) FROM task").scalar() == 2
+
+        connection.exec_driver_sql("DELETE FROM user WHERE id = 1")
+        tasks = connection.exec_driver_sql("SELECT count(*) FROM task").scalar()
+
+        assert tasks == 0
+
+
+def test_upgrade_is_idempotent():
+    engine = _baseline_engine()
+
+    upgrade_schema(engine, None)
+    upgrade_schema(engine, None)
+
+    assert get_schema_version(engine) == SCHEMA_VERSION
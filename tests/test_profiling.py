@@ -0,0 +1,65 @@
+import asyncio
+import pstats
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.profiling import PROFILE_ID_HEADER, ProfileStore, ProfilingMiddleware
+
+
+def test_profile_admin_request(client: TestClient, login, tmp_path):
+    endpoint: str = "/api/v1"
+    store = ProfileStore(tmp_path, max_files=2)
+    profiled_client = TestClient(ProfilingMiddleware(app, store=store))
+    headers = {**login("admin")[1], "X-Profile": "true"}
+
+    for _ in range(3):
+        response = profiled_client.get(f"{endpoint}/users/", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Profile-Id"] in store.list()
+
+    assert len(store.list()) == 2
+    pstats.Stats(str(store.path(store.list()[0])))
+
+
+def test_profile_requires_admin(client: TestClient, login, tmp_path):
+    endpoint: str = "/api/v1"
+    store = ProfileStore(tmp_path, max_files=2)
+    profiled_client = TestClient(ProfilingMiddleware(app, store=store))
+    headers = {**login()[1], "X-Profile": "true"}
+
+    response = profiled_client.get(f"{endpoint}/", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "X-Profile-Id" not in response.headers
+    assert store.list() == []
+
+
+def test_profile_does_not_buffer_response(tmp_path):
+    store = ProfileStore(tmp_path, max_files=2)
+    sent = []
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"a", "more_body": True})
+        # The first chunk reached the server before the response finished.
+        assert [m["type"] for m in sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+        await send({"type": "http.response.body", "body": b"b"})
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    middleware = ProfilingMiddleware(streaming_app, store=store, sample_rate=1)
+    scope = {"type": "http", "method": "GET", "path": "/export", "headers": []}
+
+    asyncio.run(middleware(scope, receive, send))
+
+    assert (PROFILE_ID_HEADER, store.list()[0].encode()) in sent[0]["headers"]
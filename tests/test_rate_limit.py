@@ -0,0 +1,61 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from main import app
+from src.core.rate_limit import RateLimitMiddleware, TokenBucket, parse_rate_limits
+from src.models.user import UserCreate
+
+
+def test_parse_rate_limits():
+    limits = parse_rate_limits("* /users=120/60, POST /auth/login=5/60")
+
+    assert [(limit.method, limit.path) for limit in limits] == [
+        ("POST", "/auth/login"),
+        ("*", "/users"),
+    ]
+    assert limits[1].matches("GET", "/users/me/tasks/1")
+    assert not limits[1].matches("GET", "/usersx")
+
+
+def test_token_bucket_refills():
+    bucket = TokenBucket(capacity=2, period=10, now=0)
+
+    assert bucket.acquire(0) == 0
+    assert bucket.acquire(0) == 0
+    assert bucket.acquire(0) == 5
+    assert bucket.acquire(5) == 0
+
+
+def test_rate_limit_login_by_ip(client: TestClient):
+    endpoint: str = "/api/v1"
+    limits = parse_rate_limits("POST /auth/login=2/60")
+    limited_client = TestClient(
+        RateLimitMiddleware(app, limits=limits), root_path=endpoint
+    )
+    user_data: UserCreate = {
+        "name": "John Doe",
+        "email": "john.doe@mail.com",
+        "password": "password",
+        "role": "user",
+    }
+    client.post(f"{endpoint}/users", json=user_data)
+    form = {"username": "john.doe@mail.com", "password": "password"}
+
+    for _ in range(2):
+        response = limited_client.post(f"{endpoint}/auth/login", data=form)
+        assert response.status_code == status.HTTP_200_OK
+
+    response = limited_client.post(f"{endpoint}/auth/login", data=form)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
+    assert limited_client.get(f"{endpoint}/").status_code == status.HTTP_200_OK
+
+
+def test_rate_limit_sheds_load(client: TestClient):
+    limited_client = TestClient(RateLimitMiddleware(app, limits=[], max_in_flight=0))
+
+    response = limited_client.get("/api/v1/")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
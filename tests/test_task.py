@@ -0,0 +1,99 @@
+import json
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+def test_import_tasks_csv(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    admin_id, headers = login("admin")
+    content = (
+        "title,description,user_id\n"
+        f"Task 1,,{admin_id}\n"
+        f"Task 2,Second task,{admin_id}\n"
+        "Task 3,,999\n"
+        f"Task 4,,not-a-number\n"
+    )
+
+    response = client.post(
+        f"{endpoint}/tasks/import",
+        files={"file": ("tasks.csv", content, "text/csv")},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["failed"] == 2
+    assert [e["line"] for e in report["chunks"][0]["errors"]] == [4, 5]
+
+    tasks = client.get(f"{endpoint}/users/me/tasks", headers=headers).json()
+    assert [task["title"] for task in tasks] == ["Task 1", "Task 2"]
+
+    stats = client.get(
+        f"{endpoint}/users/stats", params={"source": "counters"}, headers=headers
+    ).json()
+    assert stats["total_tasks"] == 2
+
+
+def test_import_export_tasks_ndjson(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    admin_id, headers = login("admin")
+    content = "".join(
+        json.dumps({"title": f"Task {i}", "user_id": admin_id}) + "\n"
+        for i in range(5)
+    ) + "{not json\n"
+
+    response = client.post(
+        f"{endpoint}/tasks/import",
+        files={"file": ("tasks.ndjson", content, "application/x-ndjson")},
+        headers=headers,
+    )
+
+    assert response.json()["inserted"] == 5
+    assert response.json()["failed"] == 1
+
+    export_response = client.get(
+        f"{endpoint}/tasks/export", params={"format": "ndjson"}, headers=headers
+    )
+    tasks = [json.loads(line) for line in export_response.text.splitlines()]
+
+    assert export_response.status_code == status.HTTP_200_OK
+    assert [task["title"] for task in tasks] == [f"Task {i}" for i in range(5)]
+
+    csv_response = client.get(f"{endpoint}/tasks/export", headers=headers)
+
+    assert csv_response.text.splitlines()[0] == "title,description,user_id,id"
+    assert len(csv_response.text.splitlines()) == 6
+
+
+def test_import_tasks_decoding(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    admin_id, headers = login("admin")
+    csv_content = f"\ufefftitle,description,user_id\nTask 1,,{admin_id}\n".encode()
+    ndjson_content = (
+        json.dumps({"title": "Task 2", "user_id": admin_id}).encode()
+        + b"\n{\"title\": \"T\xe9che\", \"user_id\": 1}\n"
+        + json.dumps({"title": "Task 3", "user_id": admin_id}).encode()
+        + b"\n"
+    )
+
+    csv_response = client.post(
+        f"{endpoint}/tasks/import",
+        files={"file": ("tasks.csv", csv_content, "text/csv")},
+        headers=headers,
+    )
+    ndjson_response = client.post(
+        f"{endpoint}/tasks/import",
+        files={"file": ("tasks.ndjson", ndjson_content, "application/x-ndjson")},
+        headers=headers,
+    )
+
+    assert csv_response.json()["inserted"] == 1
+    assert csv_response.json()["failed"] == 0
+    assert csv_response.json()["chunks"] == []
+    assert ndjson_response.status_code == status.HTTP_200_OK
+    assert ndjson_response.json()["inserted"] == 2
+    (error,) = ndjson_response.json()["chunks"][0]["errors"]
+    assert error["line"] == 2
+    assert error["error"].startswith("Invalid UTF-8")
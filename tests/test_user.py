@@ -1,7 +1,11 @@
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlmodel import Session, select
 
-from src.models.user import UserCreate
+from src.core.jobs import run_next_job
+from src.models.job import JobStatus
+from src.models.task import Task
+from src.models.user import User, UserCreate
 
 
 def test_create_user(client: TestClient):
@@ -39,3 +43,87 @@ def test_login_user(client: TestClient):
     )
 
     assert login_response.status_code == status.HTTP_200_OK
+
+
+def _create_tasks(
+    client: TestClient, endpoint: str, user_id: int, headers: dict, task_count: int
+) -> None:
+    for i in range(task_count):
+        task_response = client.post(
+            f"{endpoint}/users/me/tasks",
+            json={"title": f"Task {i}", "user_id": user_id},
+            headers=headers,
+        )
+        assert task_response.status_code == status.HTTP_201_CREATED
+
+
+def test_delete_user_cascades_tasks(client: TestClient, session: Session, login):
+    endpoint: str = "/api/v1"
+    _, headers = login("admin")
+    user_id, user_headers = login()
+    _create_tasks(client, endpoint, user_id, user_headers, 3)
+
+    response = client.delete(f"{endpoint}/users/{user_id}", headers=headers)
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert session.exec(select(Task).where(Task.user_id == user_id)).all() == []
+
+
+def test_delete_user_in_background(client: TestClient, session: Session, login):
+    endpoint: str = "/api/v1"
+    _, headers = login("admin")
+    user_id, user_headers = login()
+    _create_tasks(client, endpoint, user_id, user_headers, 3)
+
+    response = client.delete(
+        f"{endpoint}/users/{user_id}", params={"background": True}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["kind"] == "purge_user"
+    assert response.json()["status"] == "pending"
+
+    get_response = client.get(f"{endpoint}/users/{user_id}", headers=headers)
+    assert get_response.status_code == status.HTTP_404_NOT_FOUND
+
+    job = run_next_job(session)
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert session.exec(select(Task).where(Task.user_id == user_id)).all() == []
+    assert session.get(User, user_id, populate_existing=True) is None
+
+
+def test_delete_user_documents_job_response(client: TestClient):
+    paths = client.get("/openapi.json").json()["paths"]
+
+    for path in ("/users/me", "/users/{user_id}"):
+        responses = paths[path]["delete"]["responses"]
+
+        assert set(responses) >= {"202", "204"}
+        assert responses["202"]["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/JobRead"
+        }
+
+
+def test_task_stats(client: TestClient, login):
+    endpoint: str = "/api/v1"
+    _, headers = login("admin")
+    user_id, user_headers = login()
+    _create_tasks(client, endpoint, user_id, user_headers, 3)
+
+    delete_response = client.delete(
+        f"{endpoint}/users/me/tasks/1", headers=user_headers
+    )
+    assert delete_response.status_code == status.HTTP_204_NO_CONTENT
+
+    for source in ("aggregate", "counters"):
+        response = client.get(
+            f"{endpoint}/users/stats", params={"source": source}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "total_users": 2,
+            "total_tasks": 2,
+            "users": [{"user_id": user_id, "task_count": 2}],
+        }